@@ -1,22 +1,32 @@
 from __future__ import annotations
 
+import logging
+import os
 import sys
+import threading
+from collections import deque
 from dataclasses import dataclass
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QSortFilterProxyModel, Qt, QThread, Signal
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QFormLayout,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
+    QListWidget,
+    QListWidgetItem,
     QPushButton,
     QSpinBox,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QPlainTextEdit,
 )
 
+from app.results_model import ResultsTableModel
 from pipeline.config import (
     DEFAULT_DAYS,
     DEFAULT_LANGUAGE,
@@ -24,7 +34,16 @@ from pipeline.config import (
     DEFAULT_REGION,
     VERSION,
 )
-from pipeline.run import run_pipeline
+from pipeline.run import PipelineCancelledError, run_pipeline
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_RUNS = 2
+SHUTDOWN_WAIT_MS = 2000
+
+# Threads still blocked in an API call when the window closed. Kept referenced so
+# Qt does not destroy a running QThread; main() skips teardown if any remain.
+_abandoned_threads: list[QThread] = []
 
 
 @dataclass
@@ -37,27 +56,43 @@ class PipelineParams:
 
 
 class PipelineWorker(QObject):
-    finished = Signal(dict)
-    failed = Signal(str)
-    log = Signal(str)
+    finished = Signal(int, dict)
+    failed = Signal(int, str)
+    cancelled = Signal(int)
+    rows = Signal(int, list)
+    log = Signal(int, str)
 
-    def __init__(self, params: PipelineParams) -> None:
+    def __init__(self, run_id: int, params: PipelineParams) -> None:
         super().__init__()
+        self.run_id = run_id
         self.params = params
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        # Called from the GUI thread; the pipeline polls it between API calls.
+        self._cancel_event.set()
 
     def run(self) -> None:
         try:
-            self.log.emit("Running pipeline...")
+            self.log.emit(self.run_id, "Running pipeline...")
             result = run_pipeline(
                 topic=self.params.topic,
                 language=self.params.language,
                 region=self.params.region,
                 days=self.params.days,
                 min_results=self.params.min_results,
+                should_cancel=self._cancel_event.is_set,
+                on_results=self._emit_rows,
             )
-            self.finished.emit(result)
+            self.finished.emit(self.run_id, result)
+        except PipelineCancelledError:
+            self.cancelled.emit(self.run_id)
         except Exception as exc:  # noqa: BLE001
-            self.failed.emit(str(exc))
+            self.failed.emit(self.run_id, str(exc))
+
+    def _emit_rows(self, batch: list[dict]) -> None:
+        topic = self.params.topic
+        self.rows.emit(self.run_id, [{**video, "topic": topic} for video in batch])
 
 
 class MainWindow(QWidget):
@@ -79,11 +114,44 @@ class MainWindow(QWidget):
 
         self.run_button = QPushButton("Run")
         self.run_button.clicked.connect(self._start_pipeline)
+        self.cancel_button = QPushButton("Cancel selected")
+        self.cancel_button.clicked.connect(self._cancel_selected)
+        self.clear_button = QPushButton("Clear results")
+        self.clear_button.clicked.connect(self._clear_results)
 
         self.status_label = QLabel("Ready")
+
+        self.runs_list = QListWidget()
+        self.runs_list.setMaximumHeight(100)
+
+        self.results_model = ResultsTableModel(self)
+        self.results_proxy = QSortFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_proxy.setSortRole(ResultsTableModel.SortRole)
+        self.results_proxy.setFilterKeyColumn(-1)
+        self.results_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter results")
+        self.filter_input.textChanged.connect(self.results_proxy.setFilterFixedString)
+
+        self.results_view = QTableView()
+        self.results_view.setModel(self.results_proxy)
+        self.results_view.setSortingEnabled(True)
+        self.results_view.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.results_view.setWordWrap(False)
+        # Fixed row heights avoid measuring every row when thousands arrive.
+        self.results_view.verticalHeader().setDefaultSectionSize(22)
+        self.results_view.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+
         self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setMaximumBlockCount(2000)
+        self.log_output.setMaximumHeight(120)
 
         form = QFormLayout()
         form.addRow("Topic", self.topic_input)
@@ -94,16 +162,24 @@ class MainWindow(QWidget):
 
         button_row = QHBoxLayout()
         button_row.addWidget(self.run_button)
+        button_row.addWidget(self.cancel_button)
+        button_row.addWidget(self.clear_button)
         button_row.addWidget(self.status_label)
 
         layout = QVBoxLayout()
         layout.addLayout(form)
         layout.addLayout(button_row)
+        layout.addWidget(self.runs_list)
+        layout.addWidget(self.filter_input)
+        layout.addWidget(self.results_view, stretch=1)
         layout.addWidget(self.log_output)
         self.setLayout(layout)
 
-        self._thread: QThread | None = None
-        self._worker: PipelineWorker | None = None
+        self._next_run_id = 1
+        self._queue: deque[tuple[int, PipelineParams]] = deque()
+        self._active: dict[int, tuple[QThread, PipelineWorker]] = {}
+        self._run_items: dict[int, QListWidgetItem] = {}
+        self._run_topics: dict[int, str] = {}
 
     def _start_pipeline(self) -> None:
         topic = self.topic_input.text().strip()
@@ -111,9 +187,6 @@ class MainWindow(QWidget):
             self.status_label.setText("Topic is required")
             return
 
-        self.run_button.setEnabled(False)
-        self.status_label.setText("Running...")
-
         params = PipelineParams(
             topic=topic,
             language=self.language_input.text().strip() or DEFAULT_LANGUAGE,
@@ -122,45 +195,121 @@ class MainWindow(QWidget):
             min_results=self.min_results_input.value(),
         )
 
-        self._thread = QThread()
-        self._worker = PipelineWorker(params)
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_finished)
-        self._worker.failed.connect(self._on_failed)
-        self._worker.log.connect(self._append_log)
+        run_id = self._next_run_id
+        self._next_run_id += 1
+
+        item = QListWidgetItem()
+        item.setData(Qt.ItemDataRole.UserRole, run_id)
+        self.runs_list.addItem(item)
+        self._run_items[run_id] = item
+        self._run_topics[run_id] = topic
+        self._queue.append((run_id, params))
+        self._set_run_state(run_id, "Queued")
+        self._start_queued()
+
+    def _start_queued(self) -> None:
+        while self._queue and len(self._active) < MAX_CONCURRENT_RUNS:
+            run_id, params = self._queue.popleft()
+
+            thread = QThread(self)
+            worker = PipelineWorker(run_id, params)
+            worker.moveToThread(thread)
+
+            thread.started.connect(worker.run)
+            worker.finished.connect(self._on_finished)
+            worker.failed.connect(self._on_failed)
+            worker.cancelled.connect(self._on_cancelled)
+            worker.rows.connect(self._on_rows)
+            worker.log.connect(self._append_log)
+
+            worker.finished.connect(thread.quit)
+            worker.failed.connect(thread.quit)
+            worker.cancelled.connect(thread.quit)
+            thread.finished.connect(lambda run_id=run_id: self._cleanup_run(run_id))
+
+            self._active[run_id] = (thread, worker)
+            self._set_run_state(run_id, "Running")
+            thread.start()
+        self._update_status()
+
+    def _cancel_selected(self) -> None:
+        for item in self.runs_list.selectedItems():
+            run_id = item.data(Qt.ItemDataRole.UserRole)
+            queued = [entry for entry in self._queue if entry[0] == run_id]
+            if queued:
+                self._queue.remove(queued[0])
+                self._set_run_state(run_id, "Cancelled")
+            elif run_id in self._active:
+                self._active[run_id][1].cancel()
+                self._set_run_state(run_id, "Cancelling...")
+        self._update_status()
+
+    def _clear_results(self) -> None:
+        self.results_model.clear()
+        self._update_status()
+
+    def _set_run_state(self, run_id: int, state: str) -> None:
+        item = self._run_items[run_id]
+        item.setText(f"#{run_id} {self._run_topics[run_id]} - {state}")
+
+    def _update_status(self) -> None:
+        self.status_label.setText(
+            f"Running: {len(self._active)}, queued: {len(self._queue)}, "
+            f"rows: {self.results_model.total_rows()}"
+        )
 
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.failed.connect(self._thread.quit)
-        self._thread.finished.connect(self._cleanup_thread)
+    def _append_log(self, run_id: int, message: str) -> None:
+        self.log_output.appendPlainText(f"[#{run_id}] {message}")
 
-        self._thread.start()
+    def _on_rows(self, run_id: int, rows: list) -> None:
+        self.results_model.append_rows(rows)
+        self._update_status()
 
-    def _append_log(self, message: str) -> None:
-        self.log_output.appendPlainText(message)
+    def _on_finished(self, run_id: int, result: dict) -> None:
+        self._set_run_state(run_id, f"Done: {result.get('shorts_count', 0)} shorts")
+        self._append_log(run_id, f"Result: {result}")
 
-    def _on_finished(self, result: dict) -> None:
-        self.status_label.setText(f"Done: {result.get('shorts_count', 0)} shorts")
-        self.run_button.setEnabled(True)
-        self._append_log(f"Result: {result}")
+    def _on_failed(self, run_id: int, error: str) -> None:
+        self._set_run_state(run_id, "Failed")
+        self._append_log(run_id, f"Error: {error}")
 
-    def _on_failed(self, error: str) -> None:
-        self.status_label.setText("Failed")
-        self.run_button.setEnabled(True)
-        self._append_log(f"Error: {error}")
+    def _on_cancelled(self, run_id: int) -> None:
+        self._set_run_state(run_id, "Cancelled")
+        self._append_log(run_id, "Cancelled")
 
-    def _cleanup_thread(self) -> None:
-        self._worker = None
-        self._thread = None
+    def _cleanup_run(self, run_id: int) -> None:
+        thread, worker = self._active.pop(run_id, (None, None))
+        if thread is None:
+            return
+        worker.deleteLater()
+        thread.deleteLater()
+        self._start_queued()
+
+    def closeEvent(self, event) -> None:
+        self._queue.clear()
+        active = list(self._active.items())
+        for _, (thread, worker) in active:
+            worker.cancel()
+            thread.quit()
+        # Cancellation is only seen between API calls, so do not block on a
+        # request that is still in flight.
+        for run_id, (thread, worker) in active:
+            if not thread.wait(SHUTDOWN_WAIT_MS):
+                logger.warning("Run #%d did not stop in time; abandoning it", run_id)
+                thread.setParent(None)
+                _abandoned_threads.append(thread)
+        super().closeEvent(event)
 
 
 def main() -> None:
     app = QApplication(sys.argv)
     window = MainWindow()
-    window.resize(520, 420)
+    window.resize(960, 720)
     window.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    if any(thread.isRunning() for thread in _abandoned_threads):
+        os._exit(code)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
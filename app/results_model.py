@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, QTimer
+
+COLUMNS = [
+    ("topic", "Topic"),
+    ("title", "Title"),
+    ("channel_title", "Channel"),
+    ("view_count", "Views"),
+    ("published_at", "Published"),
+    ("duration", "Duration"),
+    ("url", "URL"),
+]
+
+INSERT_CHUNK = 1000
+INSERT_INTERVAL_MS = 50
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Append-only table of result rows.
+    Streamed rows are buffered and inserted in INSERT_CHUNK slices on a timer, so
+    a large batch never blocks the event loop in a single insert. Sorting and
+    filtering are left to a QSortFilterProxyModel, which maps indexes instead
+    of copying rows.
+    """
+
+    SortRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[dict] = []
+        self._pending: list[dict] = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(INSERT_INTERVAL_MS)
+        self._timer.timeout.connect(self._insert_pending)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section][1]
+        return section + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        key = COLUMNS[index.column()][0]
+        value = self._rows[index.row()].get(key)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return "" if value is None else str(value)
+        if role == self.SortRole:
+            if key == "view_count":
+                return _to_int(value)
+            return "" if value is None else str(value)
+        return None
+
+    def append_rows(self, rows: list[dict]) -> None:
+        self._pending.extend(rows)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def total_rows(self) -> int:
+        return len(self._rows) + len(self._pending)
+
+    def clear(self) -> None:
+        self._timer.stop()
+        self.beginResetModel()
+        self._rows = []
+        self._pending = []
+        self.endResetModel()
+
+    def _insert_pending(self) -> None:
+        chunk = self._pending[:INSERT_CHUNK]
+        del self._pending[:INSERT_CHUNK]
+        if chunk:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(chunk) - 1)
+            self._rows.extend(chunk)
+            self.endInsertRows()
+        if not self._pending:
+            self._timer.stop()
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
@@ -3,3 +3,5 @@ DEFAULT_DAYS = 90
 DEFAULT_MIN_RESULTS = 100
 DEFAULT_LANGUAGE = "en"
 VERSION = "0.1"
+WATCH_INTERVAL_SECONDS = 3600
+WATCH_QUOTA_PER_CYCLE = 50
@@ -3,7 +3,8 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import logging
-from typing import Iterable
+import sqlite3
+from typing import Callable, Iterable
 
 from pipeline.config import (
     DEFAULT_DAYS,
@@ -17,11 +18,21 @@ from services.sheets import write_rows
 from services.transcript import fetch_transcript
 from services.translation import translate_text
 from services.youtube import get_video_details, search_videos
+from storage.db import index_rows
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class PipelineCancelledError(RuntimeError):
+    """Raised when a caller cancels a running pipeline."""
+
+
+def _check_cancelled(should_cancel: Callable[[], bool] | None) -> None:
+    if should_cancel is not None and should_cancel():
+        raise PipelineCancelledError("Pipeline run was cancelled")
+
+
 def _published_after(days: int) -> str:
     return (dt.datetime.utcnow() - dt.timedelta(days=days)).isoformat("T") + "Z"
 
@@ -51,6 +62,8 @@ def collect_shorts(
     region: str = DEFAULT_REGION,
     days: int = DEFAULT_DAYS,
     min_results: int = DEFAULT_MIN_RESULTS,
+    should_cancel: Callable[[], bool] | None = None,
+    on_results: Callable[[list[dict]], None] | None = None,
 ) -> dict:
     logger.info("Starting pipeline for topic: %s", topic)
 
@@ -61,6 +74,7 @@ def collect_shorts(
 
     query_index = 0
     while len(results) < min_results and query_index < len(queries):
+        _check_cancelled(should_cancel)
         query = queries[query_index]
         query_index += 1
 
@@ -75,6 +89,7 @@ def collect_shorts(
             continue
 
         details = get_video_details(video_ids)
+        batch: list[dict] = []
         for video in details:
             video_id = video.get("id")
             duration = video.get("duration")
@@ -83,7 +98,10 @@ def collect_shorts(
             if not is_short_duration(duration):
                 continue
             seen_ids.add(video_id)
-            results.append(video)
+            batch.append(video)
+        results.extend(batch)
+        if batch and on_results is not None:
+            on_results(batch)
 
         if len(results) < min_results and query_index >= len(queries):
             queries = extend_queries(topic, existing=queries, language=language)
@@ -100,9 +118,13 @@ def collect_shorts(
     }
 
 
-def enrich_results(results: list[dict]) -> list[dict]:
+def enrich_results(
+    results: list[dict],
+    should_cancel: Callable[[], bool] | None = None,
+) -> list[dict]:
     rows = []
     for video in results:
+        _check_cancelled(should_cancel)
         transcript = fetch_transcript(video.get("id"))
         translation = translate_text(transcript, target_language="ru")
         row = {
@@ -120,6 +142,8 @@ def run_pipeline(
     region: str = DEFAULT_REGION,
     days: int = DEFAULT_DAYS,
     min_results: int = DEFAULT_MIN_RESULTS,
+    should_cancel: Callable[[], bool] | None = None,
+    on_results: Callable[[list[dict]], None] | None = None,
 ) -> dict:
     collection = collect_shorts(
         topic=topic,
@@ -127,9 +151,17 @@ def run_pipeline(
         region=region,
         days=days,
         min_results=min_results,
+        should_cancel=should_cancel,
+        on_results=on_results,
     )
-    rows = enrich_results(collection["results"])
+    rows = enrich_results(collection["results"], should_cancel=should_cancel)
+    _check_cancelled(should_cancel)
     write_rows(rows)
+    try:
+        index_rows(rows, topic=topic)
+    except sqlite3.Error:
+        # The local index is a cache; the rows are already written.
+        logger.exception("Failed to index %d rows for search", len(rows))
 
     return {
         "topic": topic,
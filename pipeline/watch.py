@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from pipeline.config import WATCH_INTERVAL_SECONDS, WATCH_QUOTA_PER_CYCLE
+from services.youtube import MAX_IDS_PER_REQUEST, get_video_statistics
+from storage.db import known_video_ids, update_view_counts
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def refresh_statistics(offset: int = 0, quota: int = WATCH_QUOTA_PER_CYCLE) -> dict:
+    """
+    Refresh view counts for stored videos without re-running search.
+    Each videos.list call costs one quota unit for up to MAX_IDS_PER_REQUEST ids,
+    so a cycle covers at most `quota * MAX_IDS_PER_REQUEST` videos; larger
+    libraries are walked in rotation, resuming from the returned `next_offset`.
+    """
+    ids = known_video_ids()
+    budget = max(quota, 0) * MAX_IDS_PER_REQUEST
+    if len(ids) <= budget:
+        batch = ids
+        next_offset = 0
+    else:
+        offset %= len(ids)
+        batch = (ids[offset:] + ids[:offset])[:budget]
+        next_offset = (offset + budget) % len(ids)
+
+    counts = get_video_statistics(batch)
+    changed = update_view_counts(counts)
+    units = -(-len(batch) // MAX_IDS_PER_REQUEST)
+
+    logger.info(
+        "Refreshed %d videos (%d changed, %d missing) using %d quota units",
+        len(batch),
+        changed,
+        len(batch) - len(counts),
+        units,
+    )
+    return {
+        "requested": len(batch),
+        "changed": changed,
+        "units": units,
+        "next_offset": next_offset,
+    }
+
+
+def watch(
+    interval: int = WATCH_INTERVAL_SECONDS,
+    quota: int = WATCH_QUOTA_PER_CYCLE,
+    cycles: int | None = None,
+) -> None:
+    offset = 0
+    completed = 0
+    while cycles is None or completed < cycles:
+        started = time.monotonic()
+        try:
+            offset = refresh_statistics(offset=offset, quota=quota)["next_offset"]
+        except Exception as exc:  # noqa: BLE001
+            # Keep the offset so the next cycle retries the same slice.
+            logger.error("Statistics refresh failed at offset %d: %s", offset, exc)
+        completed += 1
+        if cycles is not None and completed >= cycles:
+            break
+        time.sleep(max(interval - (time.monotonic() - started), 0))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Periodically refresh view counts of stored shorts."
+    )
+    parser.add_argument("--interval", type=int, default=WATCH_INTERVAL_SECONDS)
+    parser.add_argument("--quota", type=int, default=WATCH_QUOTA_PER_CYCLE)
+    parser.add_argument("--once", action="store_true")
+    args = parser.parse_args()
+
+    watch(
+        interval=args.interval,
+        quota=args.quota,
+        cycles=1 if args.once else None,
+    )
+
+
+if __name__ == "__main__":
+    main()
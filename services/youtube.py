@@ -12,6 +12,12 @@ load_dotenv()
 
 BASE_URL = "https://www.googleapis.com/youtube/v3"
 DEFAULT_TIMEOUT = 20
+MAX_IDS_PER_REQUEST = 50
+# Google APIs only gzip responses when the User-Agent also mentions gzip.
+GZIP_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "User-Agent": "youtube-pipeline (gzip)",
+}
 
 
 class MissingYouTubeApiKeyError(RuntimeError):
@@ -58,7 +64,7 @@ def get_video_details(video_ids: Iterable[str]) -> list[dict]:
     api_key = _require_api_key()
 
     results: list[dict] = []
-    for chunk in _chunked(ids, 50):
+    for chunk in _chunked(ids, MAX_IDS_PER_REQUEST):
         params = {
             "part": "contentDetails,snippet,statistics",
             "id": ",".join(chunk),
@@ -90,6 +96,35 @@ def get_video_details(video_ids: Iterable[str]) -> list[dict]:
     return results
 
 
+def get_video_statistics(video_ids: Iterable[str]) -> dict[str, str | None]:
+    """
+    Fetch only view counts, one quota unit per MAX_IDS_PER_REQUEST ids.
+    `fields=` trims the response to ids and view counts; videos that were
+    removed or made private are simply absent from the result. HTTP and network
+    errors (including quotaExceeded) propagate so callers can retry the batch.
+    """
+    ids = [video_id for video_id in video_ids if video_id]
+    if not ids:
+        return {}
+
+    api_key = _require_api_key()
+
+    counts: dict[str, str | None] = {}
+    for chunk in _chunked(ids, MAX_IDS_PER_REQUEST):
+        params = {
+            "part": "statistics",
+            "id": ",".join(chunk),
+            "fields": "items(id,statistics/viewCount)",
+            "key": api_key,
+        }
+        data = _request_or_raise("videos", params, headers=GZIP_HEADERS)
+        for item in data.get("items", []):
+            video_id = item.get("id")
+            if video_id:
+                counts[video_id] = (item.get("statistics") or {}).get("viewCount")
+    return counts
+
+
 def _require_api_key() -> str:
     api_key = os.getenv("YOUTUBE_API_KEY")
     if not api_key:
@@ -99,14 +134,20 @@ def _require_api_key() -> str:
     return api_key
 
 
-def _request(endpoint: str, params: dict) -> dict:
-    url = f"{BASE_URL}/{endpoint}"
+def _request(endpoint: str, params: dict, headers: dict | None = None) -> dict:
     try:
-        response = requests.get(url, params=params, timeout=DEFAULT_TIMEOUT)
-        response.raise_for_status()
+        return _request_or_raise(endpoint, params, headers=headers)
     except requests.RequestException as exc:
         logger.error("YouTube API error: %s", exc)
         return {}
+
+
+def _request_or_raise(endpoint: str, params: dict, headers: dict | None = None) -> dict:
+    url = f"{BASE_URL}/{endpoint}"
+    response = requests.get(
+        url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT
+    )
+    response.raise_for_status()
     return response.json()
 
 
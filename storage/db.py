@@ -1,11 +1,265 @@
 from __future__ import annotations
 
+import datetime as dt
 import sqlite3
 from pathlib import Path
 
 DB_PATH = Path("storage/data.db")
 
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    id TEXT PRIMARY KEY,
+    topic TEXT,
+    title TEXT,
+    description TEXT,
+    transcript TEXT,
+    translation TEXT,
+    channel_title TEXT,
+    channel_id TEXT,
+    published_at TEXT,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    duration TEXT,
+    url TEXT,
+    indexed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS video_topics (
+    video_id TEXT NOT NULL REFERENCES videos (id) ON DELETE CASCADE,
+    topic TEXT NOT NULL,
+    PRIMARY KEY (video_id, topic)
+);
+CREATE INDEX IF NOT EXISTS idx_video_topics_topic ON video_topics (topic);
+CREATE INDEX IF NOT EXISTS idx_videos_published_at ON videos (published_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5 (
+    title,
+    description,
+    transcript,
+    translation,
+    content='videos',
+    content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS videos_ai AFTER INSERT ON videos BEGIN
+    INSERT INTO videos_fts (rowid, title, description, transcript, translation)
+    VALUES (new.rowid, new.title, new.description, new.transcript, new.translation);
+END;
+CREATE TRIGGER IF NOT EXISTS videos_ad AFTER DELETE ON videos BEGIN
+    INSERT INTO videos_fts (
+        videos_fts, rowid, title, description, transcript, translation
+    )
+    VALUES (
+        'delete', old.rowid, old.title, old.description, old.transcript,
+        old.translation
+    );
+END;
+CREATE TRIGGER IF NOT EXISTS videos_au
+AFTER UPDATE OF title, description, transcript, translation ON videos BEGIN
+    INSERT INTO videos_fts (
+        videos_fts, rowid, title, description, transcript, translation
+    )
+    VALUES (
+        'delete', old.rowid, old.title, old.description, old.transcript,
+        old.translation
+    );
+    INSERT INTO videos_fts (rowid, title, description, transcript, translation)
+    VALUES (new.rowid, new.title, new.description, new.transcript, new.translation);
+END;
+"""
 
-def connect() -> sqlite3.Connection:
+# bm25() weights for title, description, transcript, translation.
+RANK_WEIGHTS = (10.0, 4.0, 1.0, 1.0)
+
+_UPSERT = """
+INSERT INTO videos (
+    id, topic, title, description, transcript, translation, channel_title,
+    channel_id, published_at, view_count, duration, url, indexed_at
+)
+VALUES (
+    :id, :topic, :title, :description, :transcript, :translation, :channel_title,
+    :channel_id, :published_at, :view_count, :duration, :url, :indexed_at
+)
+ON CONFLICT (id) DO UPDATE SET
+    topic = COALESCE(excluded.topic, videos.topic),
+    title = excluded.title,
+    description = excluded.description,
+    transcript = excluded.transcript,
+    translation = excluded.translation,
+    channel_title = excluded.channel_title,
+    channel_id = excluded.channel_id,
+    published_at = excluded.published_at,
+    view_count = excluded.view_count,
+    duration = excluded.duration,
+    url = excluded.url,
+    indexed_at = excluded.indexed_at
+"""
+
+_ADD_TOPIC = """
+INSERT OR IGNORE INTO video_topics (video_id, topic) VALUES (:id, :topic)
+"""
+
+
+_initialized_path: Path | None = None
+
+
+def init_db() -> None:
+    global _initialized_path
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        conn.executescript(SCHEMA)
+    finally:
+        conn.close()
+    _initialized_path = DB_PATH
+
+
+def connect() -> sqlite3.Connection:
+    if _initialized_path != DB_PATH:
+        init_db()
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def index_rows(rows: list[dict], topic: str | None = None) -> int:
+    """
+    Upsert pipeline rows into the local search index; returns rows indexed.
+    A video keeps every topic it was found under, and `videos.topic` holds the
+    most recent one.
+    """
+    indexed_at = dt.datetime.utcnow().isoformat("T") + "Z"
+    records = [
+        {
+            "id": row.get("id"),
+            "topic": topic,
+            "title": row.get("title"),
+            "description": row.get("description"),
+            "transcript": row.get("transcript"),
+            "translation": row.get("translation"),
+            "channel_title": row.get("channel_title"),
+            "channel_id": row.get("channel_id"),
+            "published_at": row.get("published_at"),
+            "view_count": _to_int(row.get("view_count")),
+            "duration": row.get("duration"),
+            "url": row.get("url"),
+            "indexed_at": indexed_at,
+        }
+        for row in rows
+        if row.get("id")
+    ]
+    if not records:
+        return 0
+
+    conn = connect()
+    try:
+        with conn:
+            conn.executemany(_UPSERT, records)
+            if topic:
+                conn.executemany(_ADD_TOPIC, records)
+    finally:
+        conn.close()
+    return len(records)
+
+
+def known_video_ids() -> list[str]:
+    conn = connect()
+    try:
+        rows = conn.execute("SELECT id FROM videos ORDER BY rowid").fetchall()
+    finally:
+        conn.close()
+    return [row["id"] for row in rows]
+
+
+def update_view_counts(counts: dict[str, str | int | None]) -> int:
+    """Write view counts that differ from the stored ones; returns rows changed."""
+    updates = [
+        {"id": video_id, "view_count": _to_int(value)}
+        for video_id, value in counts.items()
+        if value is not None
+    ]
+    if not updates:
+        return 0
+
+    conn = connect()
+    try:
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE videos SET view_count = :view_count "
+                "WHERE id = :id AND view_count != :view_count",
+                updates,
+            )
+            changed = conn.total_changes - before
+    finally:
+        conn.close()
+    return changed
+
+
+def search(
+    query: str,
+    topic: str | None = None,
+    published_after: str | None = None,
+    published_before: str | None = None,
+    min_views: int | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> dict:
+    """
+    Ranked full-text search over indexed shorts.
+    `published_after` is inclusive and `published_before` exclusive; both are
+    compared as ISO 8601 strings against `published_at`.
+    """
+    match = _match_expression(query)
+    if not match:
+        return {"total": 0, "results": []}
+
+    where = ["videos_fts MATCH ?"]
+    params: list = [match]
+    if topic:
+        where.append(
+            "EXISTS (SELECT 1 FROM video_topics AS t "
+            "WHERE t.video_id = v.id AND t.topic = ?)"
+        )
+        params.append(topic)
+    if published_after:
+        where.append("v.published_at >= ?")
+        params.append(published_after)
+    if published_before:
+        where.append("v.published_at < ?")
+        params.append(published_before)
+    if min_views:
+        where.append("v.view_count >= ?")
+        params.append(min_views)
+
+    base = (
+        "FROM videos_fts JOIN videos AS v ON v.rowid = videos_fts.rowid "
+        f"WHERE {' AND '.join(where)}"
+    )
+    weights = ", ".join(str(weight) for weight in RANK_WEIGHTS)
+
+    conn = connect()
+    try:
+        total = conn.execute(f"SELECT COUNT(*) {base}", params).fetchone()[0]
+        cursor = conn.execute(
+            "SELECT v.id, v.topic, v.title, v.channel_title, v.published_at, "
+            "v.view_count, v.url, "
+            "snippet(videos_fts, -1, '[', ']', '…', 12) AS snippet, "
+            f"bm25(videos_fts, {weights}) AS rank "
+            f"{base} ORDER BY rank, v.view_count DESC LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        )
+        results = [dict(row) for row in cursor]
+    finally:
+        conn.close()
+
+    return {"total": total, "results": results}
+
+
+def _match_expression(query: str) -> str:
+    # Quote every term so user input is never parsed as FTS5 query syntax.
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms if term)
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
@@ -0,0 +1,8 @@
+import pytest
+
+from storage import db
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "data.db")
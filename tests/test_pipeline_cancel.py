@@ -0,0 +1,69 @@
+import sqlite3
+
+import pytest
+
+from pipeline import run
+
+
+@pytest.fixture(autouse=True)
+def fake_services(monkeypatch):
+    monkeypatch.setattr(run, "expand_queries", lambda topic, language: ["a", "b"])
+    monkeypatch.setattr(
+        run, "extend_queries", lambda topic, existing, language: existing
+    )
+    monkeypatch.setattr(
+        run, "search_videos", lambda query, **kwargs: [f"{query}1", f"{query}2"]
+    )
+    monkeypatch.setattr(
+        run,
+        "get_video_details",
+        lambda ids: [{"id": video_id, "duration": "PT30S"} for video_id in ids],
+    )
+
+
+def test_collect_shorts_streams_batches():
+    batches = []
+
+    collection = run.collect_shorts("topic", min_results=4, on_results=batches.append)
+
+    assert [[video["id"] for video in batch] for batch in batches] == [
+        ["a1", "a2"],
+        ["b1", "b2"],
+    ]
+    assert len(collection["results"]) == 4
+
+
+def test_collect_shorts_cancels_between_queries():
+    batches = []
+
+    with pytest.raises(run.PipelineCancelledError):
+        run.collect_shorts(
+            "topic",
+            min_results=4,
+            should_cancel=lambda: bool(batches),
+            on_results=batches.append,
+        )
+
+    assert len(batches) == 1
+
+
+def test_enrich_results_cancels_before_fetching():
+    with pytest.raises(run.PipelineCancelledError):
+        run.enrich_results([{"id": "a1"}], should_cancel=lambda: True)
+
+
+def test_run_pipeline_survives_index_failure(monkeypatch):
+    written = []
+
+    def broken_index(rows, topic):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(run, "fetch_transcript", lambda video_id: "")
+    monkeypatch.setattr(run, "translate_text", lambda text, target_language: "")
+    monkeypatch.setattr(run, "write_rows", written.extend)
+    monkeypatch.setattr(run, "index_rows", broken_index)
+
+    result = run.run_pipeline("topic", min_results=2)
+
+    assert result["rows_written"] == 2
+    assert len(written) == 2
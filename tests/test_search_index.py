@@ -0,0 +1,81 @@
+import pytest
+
+from storage import db
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+def _row(video_id, title, views, published_at="2024-05-01T00:00:00Z", **extra):
+    return {
+        "id": video_id,
+        "title": title,
+        "description": extra.get("description", ""),
+        "transcript": extra.get("transcript", ""),
+        "translation": extra.get("translation", ""),
+        "published_at": published_at,
+        "view_count": str(views),
+    }
+
+
+def test_index_and_search_ranks_title_matches_first():
+    db.index_rows(
+        [
+            _row("a", "Cooking pasta", 10, transcript="we talk about rockets"),
+            _row("b", "Rockets launch", 5),
+        ],
+        topic="space",
+    )
+
+    found = db.search("rockets")
+
+    assert found["total"] == 2
+    assert [item["id"] for item in found["results"]] == ["b", "a"]
+
+
+def test_search_filters_and_pagination():
+    db.index_rows(
+        [
+            _row("a", "cats one", 100, "2024-01-10T00:00:00Z"),
+            _row("b", "cats two", 5, "2024-03-10T00:00:00Z"),
+            _row("c", "cats three", 500, "2024-06-10T00:00:00Z"),
+        ],
+        topic="pets",
+    )
+    db.index_rows([_row("d", "cats four", 900, "2024-07-01T00:00:00Z")], topic="other")
+
+    assert db.search("cats", topic="pets")["total"] == 3
+    assert db.search("cats", min_views=100, topic="pets")["total"] == 2
+    window = db.search(
+        "cats", published_after="2024-02-01", published_before="2024-06-01"
+    )
+    assert [item["id"] for item in window["results"]] == ["b"]
+
+    page = db.search("cats", limit=2, offset=2)
+    assert page["total"] == 4
+    assert len(page["results"]) == 2
+
+
+def test_reindex_keeps_every_topic():
+    db.index_rows([_row("a", "shared cats", 1)], topic="pets")
+    db.index_rows([_row("a", "shared cats", 2)], topic="funny")
+    db.index_rows([_row("a", "shared cats", 3)])
+
+    assert db.search("cats", topic="pets")["total"] == 1
+    assert db.search("cats", topic="funny")["total"] == 1
+    assert db.search("cats", topic="other")["total"] == 0
+    assert db.search("cats")["results"][0]["topic"] == "funny"
+
+
+def test_reindex_updates_fts_content():
+    db.index_rows([_row("a", "old title", 1)])
+    db.index_rows([_row("a", "new title", 2, translation="перевод")])
+
+    assert db.search("old")["total"] == 0
+    assert db.search("перевод")["results"][0]["view_count"] == 2
+
+
+def test_search_treats_query_syntax_as_text():
+    db.index_rows([_row("a", 'quote " NEAR( test', 1)])
+
+    assert db.search('" NEAR(')["total"] == 1
+    assert db.search("   ")["total"] == 0
@@ -0,0 +1,109 @@
+import pytest
+import requests
+
+from pipeline import watch
+from services import youtube
+from storage import db
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+def _seed(count):
+    db.index_rows(
+        [
+            {"id": f"v{i}", "title": f"video {i}", "view_count": "10"}
+            for i in range(count)
+        ]
+    )
+
+
+def test_update_view_counts_writes_only_changes():
+    _seed(3)
+
+    changed = db.update_view_counts({"v0": "10", "v1": "25", "v2": None, "zz": "5"})
+
+    assert changed == 1
+    assert db.search("video", min_views=20)["results"][0]["id"] == "v1"
+
+
+def test_refresh_statistics_respects_quota_and_rotates(monkeypatch):
+    _seed(120)
+    requested = []
+
+    def fake_stats(ids):
+        requested.append(list(ids))
+        return {video_id: "11" for video_id in ids}
+
+    monkeypatch.setattr(watch, "get_video_statistics", fake_stats)
+
+    first = watch.refresh_statistics(offset=0, quota=2)
+    second = watch.refresh_statistics(offset=first["next_offset"], quota=2)
+
+    assert first == {"requested": 100, "changed": 100, "units": 2, "next_offset": 100}
+    assert requested[1][:20] == [f"v{i}" for i in range(100, 120)]
+    assert requested[1][20:] == [f"v{i}" for i in range(80)]
+    assert second["changed"] == 20
+    assert second["next_offset"] == 80
+
+
+def test_failed_cycle_keeps_offset(monkeypatch):
+    _seed(120)
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    requested = []
+    real_stats = youtube.get_video_statistics
+
+    def flaky_get(url, params, headers, timeout):
+        if len(requested) == 2:
+            raise requests.ConnectionError("boom")
+        return _FakeResponse({"items": []})
+
+    def recording_stats(ids):
+        requested.append(list(ids))
+        return real_stats(ids)
+
+    monkeypatch.setattr(youtube.requests, "get", flaky_get)
+    monkeypatch.setattr(watch, "get_video_statistics", recording_stats)
+
+    watch.watch(interval=0, quota=1, cycles=3)
+
+    assert [batch[0] for batch in requested] == ["v0", "v50", "v50"]
+
+
+def test_get_video_statistics_requests_trimmed_gzip_batches(monkeypatch):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    ids = [f"v{i}" for i in range(120)]
+    calls = []
+
+    def fake_get(url, params, headers, timeout):
+        calls.append((url, params, headers))
+        items = [
+            {"id": video_id, "statistics": {"viewCount": "7"}}
+            for video_id in params["id"].split(",")
+            if video_id != "v60"
+        ]
+        return _FakeResponse({"items": items})
+
+    monkeypatch.setattr(youtube.requests, "get", fake_get)
+
+    counts = youtube.get_video_statistics(ids)
+
+    assert [len(params["id"].split(",")) for _, params, _ in calls] == [50, 50, 20]
+    for url, params, headers in calls:
+        assert url == f"{youtube.BASE_URL}/videos"
+        assert params["part"] == "statistics"
+        assert params["fields"] == "items(id,statistics/viewCount)"
+        assert headers == youtube.GZIP_HEADERS
+    assert len(counts) == 119
+    assert "v60" not in counts
+    assert counts["v0"] == "7"
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
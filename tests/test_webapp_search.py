@@ -0,0 +1,67 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from storage import db
+from webapp.main import app
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def _row(video_id, published_at, views):
+    return {
+        "id": video_id,
+        "title": f"dogs {video_id}",
+        "published_at": published_at,
+        "view_count": str(views),
+    }
+
+
+def test_search_date_window_includes_whole_end_day(client):
+    db.index_rows(
+        [
+            _row("before", "2024-02-29T23:59:59Z", 1),
+            _row("start", "2024-03-01T00:00:00Z", 2),
+            _row("end", "2024-03-10T23:59:59Z", 3),
+            _row("after", "2024-03-11T00:00:00Z", 4),
+        ]
+    )
+
+    response = client.get(
+        "/search",
+        params={"q": "dogs", "date_from": "2024-03-01", "date_to": "2024-03-10"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert {item["id"] for item in body["results"]} == {"start", "end"}
+
+
+def test_search_paginates_with_page_and_per_page(client):
+    db.index_rows([_row(f"v{i}", "2024-03-01T00:00:00Z", 100 - i) for i in range(5)])
+
+    pages = [
+        client.get("/search", params={"q": "dogs", "page": page, "per_page": 2}).json()
+        for page in (1, 2, 3)
+    ]
+
+    assert [page["total"] for page in pages] == [5, 5, 5]
+    assert [[item["id"] for item in page["results"]] for page in pages] == [
+        ["v0", "v1"],
+        ["v2", "v3"],
+        ["v4"],
+    ]
+    assert pages[2]["page"] == 3
+    assert pages[2]["per_page"] == 2
+
+
+def test_search_rejects_invalid_page(client):
+    response = client.get("/search", params={"q": "dogs", "page": 0})
+
+    assert response.status_code == 422
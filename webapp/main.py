@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import datetime as dt
 import json
+import logging
+import sqlite3
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Form, Request
+from fastapi import FastAPI, Form, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -17,8 +21,18 @@ from pipeline.config import (
 from pipeline.run import collect_shorts, enrich_results, run_pipeline
 from services.query_expander import expand_queries
 from services.sheets import write_rows
+from storage.db import index_rows, init_db, search
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_db()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 app.mount("/static", StaticFiles(directory="webapp/static"), name="static")
 
 templates = Jinja2Templates(directory="webapp/templates")
@@ -42,6 +56,37 @@ def index(request: Request) -> HTMLResponse:
     return templates.TemplateResponse("index.html", context)
 
 
+@app.get("/search")
+def search_shorts(
+    q: str = Query(..., min_length=1),
+    topic: str | None = None,
+    date_from: dt.date | None = None,
+    date_to: dt.date | None = None,
+    min_views: int | None = Query(None, ge=0),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+) -> dict:
+    published_before = None
+    if date_to:
+        published_before = (date_to + dt.timedelta(days=1)).isoformat()
+    found = search(
+        q,
+        topic=topic,
+        published_after=date_from.isoformat() if date_from else None,
+        published_before=published_before,
+        min_views=min_views,
+        limit=per_page,
+        offset=(page - 1) * per_page,
+    )
+    return {
+        "query": q,
+        "page": page,
+        "per_page": per_page,
+        "total": found["total"],
+        "results": found["results"],
+    }
+
+
 @app.post("/run", response_class=HTMLResponse)
 def run(
     request: Request,
@@ -93,6 +138,10 @@ def run(
             if results_payload:
                 rows = enrich_results(results_payload)
                 write_rows(rows)
+                try:
+                    index_rows(rows, topic=topic)
+                except sqlite3.Error:
+                    logger.exception("Failed to index %d rows for search", len(rows))
                 result = {
                     "topic": topic,
                     "query_count": query_count or len(results_payload),